@@ -56,7 +56,7 @@ async def register(user_data: UserRegister):
     """
     try:
         # Check if email already exists
-        existing_email = await User.find_one(User.email == user_data.email)
+        existing_email = await User.find_one({"email": user_data.email})
         if existing_email:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -64,7 +64,7 @@ async def register(user_data: UserRegister):
             )
 
         # Check if username already exists
-        existing_username = await User.find_one(User.username == user_data.username)
+        existing_username = await User.find_one({"username": user_data.username})
         if existing_username:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -2,6 +2,8 @@
 Database connection and initialization
 Manages MongoDB connection with Beanie ODM
 """
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from app.config import settings
@@ -18,13 +20,25 @@ class Database:
     """Database connection manager"""
 
     client: AsyncIOMotorClient = None
+    # Beanie model registration is process-wide, so a second init_db() is a no-op
+    _inited: bool = False
 
     @classmethod
-    async def connect_db(cls):
-        """Connect to MongoDB and initialize Beanie"""
+    async def connect_db(cls, verbose: bool = True, server_selection_timeout_ms: Optional[int] = None):
+        """
+        Connect to MongoDB and initialize Beanie
+        server_selection_timeout_ms overrides pymongo's default (30s); the API
+        keeps the default so it rides out replica set failovers
+        """
+        if cls._inited:
+            return
+
         try:
             # Create MongoDB client
-            cls.client = AsyncIOMotorClient(settings.MONGODB_URL)
+            options = {}
+            if server_selection_timeout_ms is not None:
+                options["serverSelectionTimeoutMS"] = server_selection_timeout_ms
+            cls.client = AsyncIOMotorClient(settings.MONGODB_URL, **options)
 
             # Get database
             database = cls.client[settings.DATABASE_NAME]
@@ -42,26 +56,38 @@ class Database:
                 ]
             )
 
-            print(f"✅ Connected to MongoDB database: {settings.DATABASE_NAME}")
+            cls._inited = True
+            if verbose:
+                print(f"✅ Connected to MongoDB database: {settings.DATABASE_NAME}")
 
         except Exception as e:
-            print(f"❌ Error connecting to MongoDB: {e}")
+            # Drop the half-initialized client so a retry starts from scratch
+            if cls.client:
+                cls.client.close()
+                cls.client = None
+            if verbose:
+                print(f"❌ Error connecting to MongoDB: {e}")
             raise
 
     @classmethod
-    async def close_db(cls):
+    async def close_db(cls, verbose: bool = True):
         """Close database connection"""
         if cls.client:
             cls.client.close()
-            print("✅ MongoDB connection closed")
+            cls.client = None
+            cls._inited = False
+            if verbose:
+                print("✅ MongoDB connection closed")
 
 
 # Helper functions for FastAPI lifespan events
-async def init_db():
+async def init_db(verbose: bool = True, server_selection_timeout_ms: Optional[int] = None):
     """Initialize database connection"""
-    await Database.connect_db()
+    await Database.connect_db(
+        verbose=verbose, server_selection_timeout_ms=server_selection_timeout_ms
+    )
 
 
-async def close_db():
+async def close_db(verbose: bool = True):
     """Close database connection"""
-    await Database.close_db()
\ No newline at end of file
+    await Database.close_db(verbose=verbose)
\ No newline at end of file
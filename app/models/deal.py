@@ -109,8 +109,8 @@ class Deal(Document):
         )
 
     async def increment_views(self):
-        self.views_count += 1
-        await self.save()
+        # Atomic $inc; the refreshed document is synced back onto self
+        await self.inc({Deal.views_count: 1})
 
     async def increment_saves(self):
         self.saves_count += 1
@@ -5,9 +5,20 @@ SaveMate API - MongoDB/Beanie
 
 from beanie import Document
 from pydantic import Field, EmailStr
+from pymongo import IndexModel
 from datetime import datetime
 from typing import Optional
 
+
+# Case-insensitive matching for email lookups; queries must pass the same
+# collation to use the email_ci index
+EMAIL_COLLATION = {"locale": "en", "strength": 2}
+
+# Created by scripts/make_admin.py, not through Settings.indexes: Beanie
+# merges declared indexes by key, so it would replace the plain email_1
+# index that exact-match lookups (login, register) rely on
+EMAIL_CI_INDEX = IndexModel([("email", 1)], name="email_ci", collation=EMAIL_COLLATION)
+
 class User(Document):
     email: EmailStr = Field(..., unique=True)
     username: str = Field(..., unique=True)
@@ -26,4 +37,9 @@ class User(Document):
     
     class Settings:
         name = "users"
-        indexes = ["email", "username"]
\ No newline at end of file
+        indexes = [
+            "email",
+            "username",
+            # Only admins are indexed, which is all list_admins ever asks for
+            IndexModel([("is_admin", 1)], name="is_admin_true", partialFilterExpression={"is_admin": True}),
+        ]
\ No newline at end of file
@@ -6,7 +6,25 @@ Pydantic models for request/response validation
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator
-import re
+
+try:
+    # google-re2 is optional: linear-time DFA matching for bulk validation
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+
+_SLUG_RE = _re.compile(r'[a-z0-9-]+')
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex_color(value: str) -> bool:
+    """Check for a #RRGGBB hex color without going through a regex engine"""
+    return (
+        len(value) == 7
+        and value[0] == '#'
+        and _HEX_DIGITS.issuperset(value[1:])
+    )
 
 
 class CategoryBase(BaseModel):
@@ -70,7 +88,7 @@ class CategoryBase(BaseModel):
     @classmethod
     def validate_slug(cls, v: str) -> str:
         """Ensure slug is URL-friendly"""
-        if not re.match(r'^[a-z0-9-]+$', v):
+        if not _SLUG_RE.fullmatch(v):
             raise ValueError(
                 'Slug must contain only lowercase letters, numbers, and hyphens'
             )
@@ -80,7 +98,7 @@ class CategoryBase(BaseModel):
     @classmethod
     def validate_color(cls, v: str) -> str:
         """Ensure color is valid hex code"""
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', v):
+        if not _is_hex_color(v):
             raise ValueError('Color must be a valid hex code (e.g., #3B82F6)')
         return v
 
@@ -143,7 +161,7 @@ class CategoryUpdate(BaseModel):
     @classmethod
     def validate_slug(cls, v: Optional[str]) -> Optional[str]:
         """Ensure slug is URL-friendly if provided"""
-        if v and not re.match(r'^[a-z0-9-]+$', v):
+        if v and not _SLUG_RE.fullmatch(v):
             raise ValueError(
                 'Slug must contain only lowercase letters, numbers, and hyphens'
             )
@@ -153,7 +171,7 @@ class CategoryUpdate(BaseModel):
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
         """Ensure color is valid hex code if provided"""
-        if v and not re.match(r'^#[0-9A-Fa-f]{6}$', v):
+        if v and not _is_hex_color(v):
             raise ValueError('Color must be a valid hex code (e.g., #3B82F6)')
         return v
 
@@ -0,0 +1,156 @@
+"""
+Integration Test Configuration for SaveMate Backend
+HTTP clients, database connection and auth fixtures for the API tests
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the session so async fixtures can be session-scoped"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+async def client():
+    """Create test client for API testing"""
+    from httpx import AsyncClient, ASGITransport
+    from app.main import app
+    
+    # Use ASGITransport to wrap the FastAPI app
+    transport = ASGITransport(app=app)
+    
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+async def async_client():
+    """Create async HTTP client shared by the whole session, with the app's lifespan entered once"""
+    from httpx import AsyncClient, ASGITransport
+    from asgi_lifespan import LifespanManager
+    from app.main import app
+
+    # Startup runs init_db (Motor + Beanie); allow for index creation on a cold
+    # database. Kept well above pymongo's 30s server selection timeout so an
+    # unreachable MongoDB surfaces as ServerSelectionTimeoutError rather than
+    # a bare lifespan TimeoutError
+    async with LifespanManager(app, startup_timeout=60):
+        transport = ASGITransport(app=app)
+
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture(scope="session")
+def motor_client(async_client):
+    """Motor client connected by the app's lifespan startup"""
+    from app.database import Database
+
+    return Database.client
+
+
+@pytest.fixture(scope="session")
+def sync_client():
+    """Create synchronous test client for single-request tests"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    # Lifespan is not entered: tests using this client never reach the database
+    client = TestClient(app)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def test_user_id():
+    """Mock user ID for testing"""
+    return "674890abcdef123456789012"  # Valid MongoDB ObjectId format
+
+
+@pytest.fixture(scope="session")
+def auth_token(test_user_id):
+    """Create authentication token (signed once per session)"""
+    try:
+        from app.core.security import create_access_token
+        token = create_access_token(data={"sub": test_user_id})
+        return token
+    except Exception as e:
+        print(f"Warning: Could not create real token: {e}")
+        return "mock_token_for_testing"
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Create authorization headers"""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def wrong_auth_headers():
+    """Authorization headers for a user who owns no test data (signed once per session)"""
+    from app.core.security import create_access_token
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': 'different_user_id'})}"}
+
+
+@pytest.fixture
+def sample_deal_data():
+    """Sample deal data for testing"""
+    return {
+        "title": "Test Deal - 50% Off",
+        "description": "This is a comprehensive test deal for automated testing purposes with sufficient length to meet requirements.",
+        "original_price": 100.0,
+        "discounted_price": 50.0,
+        "category": "food",
+        "business_name": "Test Business",
+        "location": {
+            "address": "Test Street 123",
+            "city": "Warsaw",
+            "postal_code": "00-001",
+            "country": "Poland"
+        },
+        "end_date": (datetime.utcnow() + timedelta(days=30)).isoformat(),
+        "tags": ["test", "food"]
+    }
+
+
+@pytest.fixture
+async def sample_deal(client, auth_headers, sample_deal_data):
+    """Create a sample deal for testing (fixture)"""
+    # Create a deal
+    response = await client.post(
+        "/api/v1/deals/",
+        json=sample_deal_data,
+        headers=auth_headers
+    )
+    
+    if response.status_code == 201:
+        deal = response.json()
+        yield deal
+        
+        # Cleanup: delete the deal after test
+        try:
+            await client.delete(
+                f"/api/v1/deals/{deal['id']}",
+                headers=auth_headers
+            )
+        except:
+            pass  # Ignore cleanup errors
+    else:
+        # If creation failed, yield None
+        yield None
+
+
+@pytest.fixture
+async def test_business_user():
+    """Mock business user for testing"""
+    return {
+        "id": "674890abcdef123456789012",
+        "email": "business@test.com",
+        "is_business": True
+    }
\ No newline at end of file
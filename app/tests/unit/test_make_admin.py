@@ -0,0 +1,133 @@
+"""
+make_admin Script Tests for SaveMate
+Tests the input helpers of scripts/make_admin.py without requiring database
+"""
+
+import os
+import sys
+import pytest
+
+from scripts import make_admin
+
+
+@pytest.fixture
+def stdin_pipe(monkeypatch):
+    """Point sys.stdin at a pipe; returns a function that writes bytes and closes the write end"""
+    read_fd, write_fd = os.pipe()
+    stdin = os.fdopen(read_fd, "r", encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(make_admin, "_stdin_buffer", bytearray())
+    closed = []
+
+    def feed(data: bytes):
+        os.write(write_fd, data)
+        os.close(write_fd)
+        closed.append(write_fd)
+
+    yield feed
+
+    if not closed:
+        os.close(write_fd)
+    stdin.close()
+
+
+class TestParseEmails:
+    """Test splitting the email prompt's input"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("a@x.com", ["a@x.com"]),
+        ("a@x.com,b@x.com", ["a@x.com", "b@x.com"]),
+        ("a@x.com b@x.com\tc@x.com", ["a@x.com", "b@x.com", "c@x.com"]),
+        ("  a@x.com , b@x.com,,  ", ["a@x.com", "b@x.com"]),
+    ])
+    def test_separators(self, text, expected):
+        """Commas and/or whitespace separate emails; empty pieces are dropped"""
+        assert make_admin._parse_emails(text) == expected
+
+    def test_repeats_dropped_in_order(self):
+        """Exact repeats are dropped and the first-seen order is kept"""
+        assert make_admin._parse_emails("b@x.com a@x.com b@x.com") == ["b@x.com", "a@x.com"]
+
+    def test_case_variants_kept(self):
+        """Emails are matched exactly, so case variants are distinct entries"""
+        assert make_admin._parse_emails("a@x.com A@x.com") == ["a@x.com", "A@x.com"]
+
+    @pytest.mark.parametrize("text", ["", "   ", " , ,\n"])
+    def test_blank_input(self, text):
+        """Blank input yields no emails"""
+        assert make_admin._parse_emails(text) == []
+
+
+class TestReadLine:
+    """Test the raw stdin line reader used by the prompts"""
+
+    def test_lines_from_one_read(self, stdin_pipe):
+        """Several lines arriving in one read are returned one per call"""
+        stdin_pipe(b"1\na@x.com\n3\n")
+
+        assert make_admin._read_line() == "1"
+        assert make_admin._read_line() == "a@x.com"
+        assert make_admin._read_line() == "3"
+        with pytest.raises(EOFError):
+            make_admin._read_line()
+
+    def test_crlf_stripped(self, stdin_pipe):
+        """Windows line endings don't leak a trailing carriage return"""
+        stdin_pipe(b"2\r\n")
+
+        assert make_admin._read_line() == "2"
+
+    def test_last_line_without_newline(self, stdin_pipe):
+        """A final unterminated line is returned before EOF is reported, like input()"""
+        stdin_pipe(b"1\na@x.com")
+
+        assert make_admin._read_line() == "1"
+        assert make_admin._read_line() == "a@x.com"
+        with pytest.raises(EOFError):
+            make_admin._read_line()
+
+    def test_empty_input(self, stdin_pipe):
+        """Closed stdin with nothing buffered raises EOFError"""
+        stdin_pipe(b"")
+
+        with pytest.raises(EOFError):
+            make_admin._read_line()
+
+    def test_empty_line(self, stdin_pipe):
+        """An empty line is an empty string, not EOF"""
+        stdin_pipe(b"\n4\n")
+
+        assert make_admin._read_line() == ""
+        assert make_admin._read_line() == "4"
+
+    def test_line_longer_than_one_read(self, stdin_pipe):
+        """A line spanning several os.read() chunks is joined back together"""
+        long_line = "a" * 10000 + "@x.com"
+        stdin_pipe(long_line.encode() + b"\n")
+
+        assert make_admin._read_line() == long_line
+
+    def test_utf8_decoded(self, stdin_pipe):
+        """Input is decoded with stdin's encoding"""
+        stdin_pipe("zażółć@x.pl\n".encode("utf-8"))
+
+        assert make_admin._read_line() == "zażółć@x.pl"
+
+
+class TestAsyncInput:
+    """Test the daemon-thread prompt wrapper"""
+
+    @pytest.mark.asyncio
+    async def test_returns_line(self, stdin_pipe):
+        """The line read on the thread is delivered to the awaiting coroutine"""
+        stdin_pipe(b"3\n")
+
+        assert await make_admin._ainput("Select option (1-4): ") == "3"
+
+    @pytest.mark.asyncio
+    async def test_eof_raised_in_caller(self, stdin_pipe):
+        """EOF on the thread surfaces as EOFError in the awaiting coroutine"""
+        stdin_pipe(b"")
+
+        with pytest.raises(EOFError):
+            await make_admin._ainput("Select option (1-4): ")
@@ -0,0 +1,218 @@
+"""
+Validation Tests for SaveMate Deals API
+Tests data validation and business logic without requiring database
+"""
+
+import sys
+import pytest
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from pydantic import ValidationError
+from freezegun import freeze_time
+
+from app.schemas.deal_schema import DealCreate
+from app.models.deal import Deal, DealStatus
+
+
+# Read-only building blocks for payloads; tests override single keys with {**BASE_PAYLOAD, ...}
+_LOC = MappingProxyType({
+    "address": "Test Street 123",
+    "city": "Warsaw",
+    "postal_code": "00-001",
+    "country": "Poland"
+})
+
+BASE_PAYLOAD = MappingProxyType({
+    "title": "Valid Deal Title",
+    "description": "A valid description with sufficient length for all requirements and validation.",
+    "original_price": 100.0,
+    "discounted_price": 50.0,
+    "category": "food",
+    "business_name": "Test Business",
+    "location": dict(_LOC)
+})
+
+# (field, bad_value) pairs that DealCreate must reject
+INVALID_CASES = [
+    pytest.param("title", "Bad", id="title_min_length"),  # min 5 chars
+    pytest.param("title", "X" * 201, id="title_max_length"),  # max 200 chars
+    pytest.param("description", "Too short", id="description_min_length"),  # min 20 chars
+    pytest.param("description", "X" * 2001, id="description_max_length"),  # max 2000 chars
+    pytest.param("original_price", -100.0, id="original_price_must_be_positive"),
+    pytest.param("original_price", 0.0, id="zero_price_not_allowed"),
+    pytest.param("discounted_price", -50.0, id="discounted_price_must_be_positive"),
+    pytest.param("category", "invalid_category_xyz", id="category_must_be_valid_enum"),
+]
+
+
+# The clock is frozen here for every test in this module, so datetime.utcnow()
+# in the schema validators and Deal methods agrees with the date fixtures
+FROZEN_NOW = datetime(2025, 1, 1)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_time():
+    with freeze_time(FROZEN_NOW) as frozen:
+        yield frozen
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Single reference time for every date in this module"""
+    return FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def future_end(now):
+    return now + timedelta(days=7)
+
+
+@pytest.fixture(scope="session")
+def past_end(now):
+    return now - timedelta(days=1)
+
+
+@pytest.fixture(scope="session")
+def past_start(now):
+    return now - timedelta(days=1)
+
+
+class TestDealValidation:
+    """Test deal data validation using Pydantic schemas"""
+    
+    @pytest.mark.parametrize(("field", "bad_value"), INVALID_CASES)
+    def test_field_validation(self, future_end, field, bad_value):
+        """Test each invalid field value is rejected and reported against that field"""
+        
+        with pytest.raises(ValidationError) as exc_info:
+            DealCreate(**{**BASE_PAYLOAD, "end_date": future_end, field: bad_value})
+        
+        assert any(e["loc"][0] == field for e in exc_info.value.errors())
+    
+    def test_valid_deal_creation(self, future_end):
+        """Test that valid deal with all correct fields passes validation"""
+        
+        # Create valid deal with all required fields
+        deal = DealCreate(**BASE_PAYLOAD, end_date=future_end)
+        
+        # Verify fields
+        assert deal.title == BASE_PAYLOAD["title"]
+        assert deal.original_price == 100.0
+        assert deal.discounted_price == 50.0
+        assert deal.category == "food"
+        assert deal.location["city"] == "Warsaw"
+    
+    @pytest.mark.parametrize("category", [
+        "food", "drinks", "shopping", "entertainment",
+        "health", "beauty", "services", "travel",
+        "electronics", "other"
+    ])
+    def test_all_valid_categories(self, future_end, category):
+        """Test that all valid category enums are accepted"""
+        
+        deal = DealCreate(**{**BASE_PAYLOAD, "category": category, "end_date": future_end})
+        assert deal.category == category
+
+
+@pytest.fixture
+def base_deal_kwargs():
+    """Deal fields shared by the model logic tests; prices and dates vary per test"""
+    return dict(
+        title="Test Deal Title",
+        description="Test description with sufficient length for all requirements and validation purposes.",
+        category="food",
+        business_id="674890abcdef123456789012",
+        business_name="Test Business",
+        location=dict(_LOC),
+        created_by="674890abcdef123456789012"
+    )
+
+
+class TestDealModelLogic:
+    """Test Deal model business logic methods"""
+    
+    @pytest.mark.parametrize(("orig", "disc", "pct"), [(100, 50, 50), (100, 25, 75), (200, 150, 25)])
+    def test_discount_calculation(self, base_deal_kwargs, future_end, orig, disc, pct):
+        """Test discount percentage calculation"""
+        
+        deal = Deal(
+            **base_deal_kwargs,
+            original_price=float(orig),
+            discounted_price=float(disc),
+            end_date=future_end
+        )
+        
+        # Calculate discount
+        deal.calculate_discount_percentage()
+        
+        assert deal.discount_percentage == pct
+    
+    def test_is_expired_returns_false_for_future_date(self, base_deal_kwargs, future_end):
+        """Test deal is NOT expired when end_date is in the future"""
+        
+        deal = Deal(
+            **base_deal_kwargs,
+            original_price=100.0,
+            discounted_price=50.0,
+            end_date=future_end  # 7 days in future
+        )
+        
+        # Check expiration
+        is_expired = deal.is_expired()
+        
+        assert is_expired == False
+    
+    def test_is_expired_returns_true_for_past_date(self, base_deal_kwargs, past_end):
+        """Test deal IS expired when end_date is in the past"""
+        
+        deal = Deal(
+            **base_deal_kwargs,
+            original_price=100.0,
+            discounted_price=50.0,
+            end_date=past_end  # Yesterday
+        )
+        
+        # Check expiration
+        is_expired = deal.is_expired()
+        
+        assert is_expired == True
+    
+    def test_is_valid_returns_true_for_active_valid_deal(self, base_deal_kwargs, past_start, future_end):
+        """Test deal is valid when active and within date range"""
+        
+        deal = Deal(
+            **base_deal_kwargs,
+            original_price=100.0,
+            discounted_price=50.0,
+            start_date=past_start,  # Started yesterday
+            end_date=future_end,  # Ends in 7 days
+            status=DealStatus.ACTIVE
+        )
+        
+        # Check validity
+        is_valid = deal.is_valid()
+        
+        assert is_valid == True
+    
+    def test_is_valid_returns_false_for_inactive_deal(self, base_deal_kwargs, past_start, future_end):
+        """Test deal is invalid when status is not active"""
+        
+        deal = Deal(
+            **base_deal_kwargs,
+            original_price=100.0,
+            discounted_price=50.0,
+            start_date=past_start,
+            end_date=future_end,
+            status=DealStatus.INACTIVE  # Inactive status
+        )
+        
+        # Check validity
+        is_valid = deal.is_valid()
+        
+        assert is_valid == False
+
+
+# Run tests if executed directly; coverage is left to the full pytest run
+# From the project root: python -m app.tests.unit.test_validation
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "--no-cov"]))
\ No newline at end of file
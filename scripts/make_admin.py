@@ -1,125 +1,427 @@
 """
 Script to grant admin privileges to a user
-Usage: python scripts/make_admin.py
+Usage: python scripts/make_admin.py [--count]
 """
 
+import argparse
 import asyncio
+import os
+import re
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+
 from app.database import init_db, close_db
-from app.models.user import User
+from app.models.user import User, EMAIL_COLLATION, EMAIL_CI_INDEX
+
+
+# Rows buffered per stdout write when listing admins
+LIST_CHUNK_SIZE = 500
+
+# An interactive tool should fail fast when MongoDB is unreachable rather
+# than wait out pymongo's default 30s; the API keeps the default
+SERVER_SELECTION_TIMEOUT_MS = 2000
+
+# _connect() task shared by every helper, so the helpers below can also be
+# reused as a library; amain() starts it early to overlap with the prompt
+_init_task = None
+
+
+def _start_db():
+    """Start connecting in the background unless an attempt is running or succeeded"""
+    global _init_task
+    # A failed or cancelled attempt is retried rather than cached for good
+    if _init_task is None or (
+        _init_task.done() and (_init_task.cancelled() or _init_task.exception() is not None)
+    ):
+        _init_task = asyncio.create_task(_connect())
+
+
+async def _connect():
+    """Initialize the database and the collated email index the lookups below use"""
+    # Quiet: it finishes while a prompt is waiting, and every action
+    # reports connection errors itself
+    await init_db(verbose=False, server_selection_timeout_ms=SERVER_SELECTION_TIMEOUT_MS)
+    # A no-op once the index exists
+    await User.get_motor_collection().create_indexes([EMAIL_CI_INDEX])
+
+
+async def _ensure_db():
+    """Wait until the database connection is initialized"""
+    _start_db()
+    await _init_task
+
+
+async def _resolve_user(collection, email: str, projection: dict):
+    """
+    Find a user by exact email, falling back to a case-insensitive match
+    only when it is unambiguous.
+    Returns (user, candidates): candidates lists the case variants when
+    several users match, in which case user is None.
+    """
+    user = await collection.find_one({"email": email}, projection)
+    if user is not None:
+        return user, []
+    
+    matches = await collection.find(
+        {"email": email}, projection, collation=EMAIL_COLLATION
+    ).limit(10).to_list(length=10)
+    if len(matches) == 1:
+        return matches[0], []
+    return None, matches
+
+
+def _print_candidates(email: str, candidates: list):
+    """Refuse an email that differs only in case from several users"""
+    print(f"❌ '{email}' matches several users that differ only in case; enter the exact email:")
+    for u in candidates:
+        print(f"   - {u['email']} ({u['username']})")
 
 
 async def make_admin(email: str):
     """Make a user an admin"""
     print(f"🔍 Searching for user: {email}")
-    await init_db()
-    
     try:
-        user = await User.find_one(User.email == email)
+        await _ensure_db()
+        collection = User.get_motor_collection()
         
-        if not user:
-            print(f"❌ User with email '{email}' not found")
-            print("💡 Available users:")
-            all_users = await User.find_all().to_list()
-            for u in all_users:
-                print(f"   - {u.email} ({u.username})")
-            return
+        details = {"email": 1, "username": 1, "is_admin": 1, "is_business_owner": 1}
         
-        if user.is_admin:
-            print(f"ℹ️  User {email} is already an admin")
+        # Exact email: write and read back the printed fields in one round
+        # trip; only matches users who are not admins yet
+        user = await collection.find_one_and_update(
+            {"email": email, "is_admin": {"$ne": True}},
+            {"$set": {"is_admin": True}},
+            projection=details,
+            return_document=ReturnDocument.AFTER
+        )
+        
+        if user is None:
+            # Nothing updated: already an admin, a different capitalization,
+            # or no such user
+            user, candidates = await _resolve_user(collection, email, details)
+            
+            if candidates:
+                _print_candidates(email, candidates)
+                return
+            
+            if user is None:
+                print(f"❌ User with email '{email}' not found")
+                # Bounded hint instead of dumping the whole collection: a
+                # case-insensitive prefix range on the email_ci index, so
+                # limit(10) also bounds the index scan ("\uffff" sorts last
+                # under the collation)
+                local_part = email.split("@")[0]
+                similar = []
+                if local_part:
+                    similar = await collection.find(
+                        {"email": {"$gte": local_part, "$lt": local_part + "\uffff"}},
+                        {"_id": 0, "email": 1, "username": 1},
+                        collation=EMAIL_COLLATION
+                    ).limit(10).to_list(length=10)
+                if similar:
+                    print("💡 Similar users:")
+                    for u in similar:
+                        print(f"   - {u['email']} ({u['username']})")
+                return
+            
+            # Users created before is_admin existed have no such field
+            if user.get("is_admin", False):
+                print(f"ℹ️  User {user['email']} is already an admin")
+            else:
+                # Update the one resolved user by _id, never by the collated email
+                user = await collection.find_one_and_update(
+                    {"_id": user["_id"]},
+                    {"$set": {"is_admin": True}},
+                    projection=details,
+                    return_document=ReturnDocument.AFTER
+                )
+                if user is None:
+                    print(f"❌ User with email '{email}' not found")
+                    return
+                print(f"✅ Successfully granted admin privileges to {user['email']}")
         else:
-            user.is_admin = True
-            await user.save()
             print(f"✅ Successfully granted admin privileges to {email}")
         
         print(f"\n📋 User Details:")
-        print(f"   Email: {user.email}")
-        print(f"   Username: {user.username}")
-        print(f"   Admin: {user.is_admin}")
-        print(f"   Business Owner: {user.is_business_owner}")
+        print(f"   Email: {user['email']}")
+        print(f"   Username: {user['username']}")
+        print(f"   Admin: {user.get('is_admin', False)}")
+        print(f"   Business Owner: {user.get('is_business_owner', False)}")
         
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-    finally:
-        await close_db()
+    except PyMongoError as e:
+        print(f"❌ Database error ({e.__class__.__name__}): {e}")
 
 
 async def list_admins():
     """List all admin users"""
     print("👑 Admin Users:")
-    await init_db()
-    
     try:
-        admins = await User.find(User.is_admin == True).to_list()
+        await _ensure_db()
+        found = False
+        lines = []
+        async for admin in User.get_motor_collection().find(
+            {"is_admin": True}, {"_id": 0, "email": 1, "username": 1}
+        ):
+            lines.append(f"   - {admin['email']} ({admin['username']})")
+            # One write per chunk rather than one print per row
+            if len(lines) == LIST_CHUNK_SIZE:
+                sys.stdout.write("\n".join(lines) + "\n")
+                lines.clear()
+                found = True
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            found = True
         
-        if not admins:
+        if not found:
             print("   No admin users found")
-        else:
-            for admin in admins:
-                print(f"   - {admin.email} ({admin.username})")
     
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-    finally:
-        await close_db()
+    except PyMongoError as e:
+        print(f"❌ Database error ({e.__class__.__name__}): {e}")
 
 
 async def remove_admin(email: str):
     """Remove admin privileges from a user"""
     print(f"🔍 Searching for user: {email}")
-    await init_db()
-    
     try:
-        user = await User.find_one(User.email == email)
+        await _ensure_db()
+        collection = User.get_motor_collection()
         
-        if not user:
-            print(f"❌ User with email '{email}' not found")
+        # Exact email and only current admins, so the common case is a
+        # single write
+        result = await collection.update_one(
+            {"email": email, "is_admin": True}, {"$set": {"is_admin": False}}
+        )
+        
+        if result.modified_count:
+            print(f"✅ Successfully removed admin privileges from {email}")
             return
         
-        if not user.is_admin:
-            print(f"ℹ️  User {email} is not an admin")
+        # Nothing updated: not an admin, a different capitalization, or no such user
+        user, candidates = await _resolve_user(
+            collection, email, {"email": 1, "username": 1, "is_admin": 1}
+        )
+        if candidates:
+            _print_candidates(email, candidates)
+        elif user is None:
+            print(f"❌ User with email '{email}' not found")
+        elif not user.get("is_admin", False):
+            print(f"ℹ️  User {user['email']} is not an admin")
         else:
-            user.is_admin = False
-            await user.save()
-            print(f"✅ Successfully removed admin privileges from {email}")
+            # Update the one resolved user by _id, never by the collated email
+            result = await collection.update_one(
+                {"_id": user["_id"], "is_admin": True}, {"$set": {"is_admin": False}}
+            )
+            if result.modified_count:
+                print(f"✅ Successfully removed admin privileges from {user['email']}")
+            else:
+                print(f"ℹ️  User {user['email']} is not an admin")
+    
+    except PyMongoError as e:
+        print(f"❌ Database error ({e.__class__.__name__}): {e}")
+
+
+async def count_admins() -> bool:
+    """
+    Print the bare number of admin users without fetching any of them,
+    for use in scripts. Errors go to stderr; returns False on failure.
+    """
+    try:
+        await _ensure_db()
+        # Served by the partial is_admin index
+        count = await User.get_motor_collection().count_documents({"is_admin": True})
+        print(count)
+        return True
     
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
+    except PyMongoError as e:
+        print(f"❌ Database error ({e.__class__.__name__}): {e}", file=sys.stderr)
+        return False
+
+
+async def set_admin_many(emails: list, is_admin: bool):
+    """Grant or remove admin privileges for several users in one update"""
+    action = "Granted" if is_admin else "Removed"
+    print(f"🔍 Updating {len(emails)} users")
+    try:
+        await _ensure_db()
+        collection = User.get_motor_collection()
+        
+        # Exact emails only: a collated $in would also flip every case
+        # variant of an address. The update and the lookup of which emails
+        # exist are independent, so they overlap on the connection pool
+        result, existing = await asyncio.gather(
+            collection.update_many(
+                {"email": {"$in": emails}}, {"$set": {"is_admin": is_admin}}
+            ),
+            collection.find(
+                {"email": {"$in": emails}}, {"_id": 0, "email": 1}
+            ).to_list(length=None),
+        )
+        
+        known = {u["email"] for u in existing}
+        missing = [e for e in emails if e not in known]
+        
+        print(f"✅ {action} admin privileges: {result.modified_count} changed, "
+              f"{result.matched_count - result.modified_count} unchanged, "
+              f"{len(missing)} not found")
+        for email in missing:
+            print(f"   ❌ {email}")
+        if missing:
+            print("💡 Emails are matched exactly here; enter a single email for a case-insensitive lookup")
+    
+    except PyMongoError as e:
+        print(f"❌ Database error ({e.__class__.__name__}): {e}")
+
+
+def _parse_emails(text: str) -> list:
+    """Split a comma and/or whitespace separated list of emails, dropping repeats"""
+    return list(dict.fromkeys(e for e in re.split(r"[,\s]+", text.strip()) if e))
+
+
+# Bytes read from stdin past the last returned line
+_stdin_buffer = bytearray()
+
+
+def _read_line() -> str:
+    """
+    Read one line from stdin's file descriptor, like input() without the prompt.
+    Bypasses sys.stdin's buffer: a daemon thread blocked inside it holds its
+    lock, which is fatal at interpreter shutdown.
+    """
+    while True:
+        line, sep, rest = _stdin_buffer.partition(b"\n")
+        if sep:
+            _stdin_buffer[:] = rest
+            break
+        chunk = os.read(sys.stdin.fileno(), 4096)
+        if not chunk:
+            if not _stdin_buffer:
+                raise EOFError
+            line = bytes(_stdin_buffer)
+            _stdin_buffer.clear()
+            break
+        _stdin_buffer.extend(chunk)
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+
+async def _ainput(prompt: str) -> str:
+    """
+    input() on a daemon thread.
+    asyncio.to_thread() would use the default executor, which asyncio.run()
+    joins on exit, so Ctrl+C at a prompt hung until Enter was pressed.
+    EOFError is re-raised in the caller.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(result, error):
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+    
+    def read():
+        result, error = None, None
+        try:
+            result = _read_line()
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            pass  # The loop already closed; nobody is waiting
+    
+    print(prompt, end="", flush=True)
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def amain(count_only: bool = False) -> int:
+    """
+    Menu loop; the database is connected once and closed on exit.
+    Returns the process exit status.
+    """
+    global _init_task
+    # Connect while the menu is shown and the user is typing
+    _start_db()
+    try:
+        if count_only:
+            return 0 if await count_admins() else 1
+        
+        while True:
+            print("=" * 60)
+            print("SaveMate Admin Management")
+            print("=" * 60)
+            print()
+            print("1. Grant admin privileges")
+            print("2. Remove admin privileges")
+            print("3. List all admins")
+            print("4. Exit")
+            print()
+            
+            try:
+                choice = (await _ainput("Select option (1-4): ")).strip()
+            except EOFError:
+                choice = "4"
+            
+            if choice in ("1", "2"):
+                # Retry a failed connection while the user is typing; a no-op
+                # once connected (init_beanie already did server selection)
+                _start_db()
+                try:
+                    emails = _parse_emails(
+                        await _ainput("Enter user email(s), comma or space separated: ")
+                    )
+                except EOFError:
+                    # Same as choosing Exit
+                    print("\n👋 Goodbye!")
+                    break
+                if not emails:
+                    print("❌ No email given")
+                elif len(emails) > 1:
+                    await set_admin_many(emails, is_admin=(choice == "1"))
+                elif choice == "1":
+                    await make_admin(emails[0])
+                else:
+                    await remove_admin(emails[0])
+            elif choice == "3":
+                await list_admins()
+            elif choice == "4":
+                print("👋 Goodbye!")
+                break
+            else:
+                print("❌ Invalid option")
+            print()
+        return 0
     finally:
-        await close_db()
+        # Don't wait out a connection attempt nobody needs any more
+        if not _init_task.done():
+            _init_task.cancel()
+        await asyncio.gather(_init_task, return_exceptions=True)
+        # Keep --count's stdout to the number alone
+        await close_db(verbose=not count_only)
+        _init_task = None
 
 
 def main():
     """Main function with menu"""
-    print("=" * 60)
-    print("SaveMate Admin Management")
-    print("=" * 60)
-    print()
-    print("1. Grant admin privileges")
-    print("2. Remove admin privileges")
-    print("3. List all admins")
-    print("4. Exit")
-    print()
-    
-    choice = input("Select option (1-4): ").strip()
+    parser = argparse.ArgumentParser(description="SaveMate admin management")
+    parser.add_argument("--count", action="store_true", help="print the number of admins and exit")
+    args = parser.parse_args()
     
-    if choice == "1":
-        email = input("Enter user email: ").strip()
-        asyncio.run(make_admin(email))
-    elif choice == "2":
-        email = input("Enter user email: ").strip()
-        asyncio.run(remove_admin(email))
-    elif choice == "3":
-        asyncio.run(list_admins())
-    elif choice == "4":
-        print("👋 Goodbye!")
-    else:
-        print("❌ Invalid option")
+    try:
+        sys.exit(asyncio.run(amain(count_only=args.count)))
+    except KeyboardInterrupt:
+        # amain() has already closed the connection on its way out
+        print("\n👋 Goodbye!")
 
 
 if __name__ == "__main__":